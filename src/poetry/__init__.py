@@ -1 +1,11 @@
 __path__ = __import__("pkgutil").extend_path(__path__, __name__)  # type: ignore[has-type]
+
+
+def __getattr__(name: str) -> str:
+    # Defer reading the version metadata until it is actually needed.
+    if name == "__version__":
+        from poetry.__version__ import __version__
+
+        return __version__
+
+    raise AttributeError(name)
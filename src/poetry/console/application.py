@@ -1,29 +1,29 @@
+import functools
 import logging
 import re
 
 from contextlib import suppress
 from importlib import import_module
+from itertools import chain
 from typing import TYPE_CHECKING
 from typing import Any
-from typing import Callable
+from typing import Dict
 from typing import Optional
-from typing import Type
 from typing import cast
 
 from cleo.application import Application as BaseApplication
-from cleo.events.console_events import COMMAND
-from cleo.events.event_dispatcher import EventDispatcher
 from cleo.exceptions import CleoException
 from cleo.formatters.style import Style
 from cleo.io.inputs.argv_input import ArgvInput
+from cleo.io.inputs.option import Option
 from poetry.core.utils._compat import PY37
 
-from poetry.__version__ import __version__
 from poetry.console.command_loader import CommandLoader
 from poetry.console.commands.command import Command
 
 
 if TYPE_CHECKING:
+    from cleo.commands.command import Command as BaseCommand
     from cleo.events.console_command_event import ConsoleCommandEvent
     from cleo.io.inputs.definition import Definition
     from cleo.io.inputs.input import Input
@@ -37,14 +37,43 @@ if TYPE_CHECKING:
     from poetry.poetry import Poetry
 
 
-def load_command(name: str) -> Callable:
-    def _load() -> Type[Command]:
-        words = name.split(" ")
-        module = import_module("poetry.console.commands." + ".".join(words))
-        command_class = getattr(module, "".join(c.title() for c in words) + "Command")
-        return command_class()
+def _load_command(module_path: str, class_name: str) -> Command:
+    module = import_module(module_path)
+    command_class = getattr(module, class_name)
 
-    return _load
+    return command_class()
+
+
+class _LazyImportProxy:
+    """
+    A proxy that resolves a module attribute on first use and caches it,
+    so the import machinery only runs once per process.
+    """
+
+    def __init__(self, module: str, attribute: str) -> None:
+        self._module = module
+        self._attribute = attribute
+        self._target: Optional[Any] = None
+
+    def _resolve(self) -> Any:
+        if self._target is None:
+            self._target = getattr(import_module(self._module), self._attribute)
+
+        return self._target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+
+def lazy_import(module: str, attribute: str) -> _LazyImportProxy:
+    return _LazyImportProxy(module, attribute)
+
+
+_Factory = lazy_import("poetry.factory", "Factory")
+_Installer = lazy_import("poetry.installation.installer", "Installer")
 
 
 COMMANDS = [
@@ -89,35 +118,92 @@ COMMANDS = [
     "source show",
 ]
 
+# The module path and class name of each command are derived
+# from its name once, at import time.
+_COMMAND_SPECS = [
+    (
+        name,
+        "poetry.console.commands." + name.replace(" ", "."),
+        "".join(c.title() for c in name.split(" ")) + "Command",
+    )
+    for name in COMMANDS
+]
+
+# The factories are identical for every Application instance,
+# so they are built a single time at import.
+_COMMAND_FACTORIES = {
+    name: functools.partial(_load_command, module_path, class_name)
+    for name, module_path, class_name in _COMMAND_SPECS
+}
+
+_NO_PLUGINS_OPTION = Option("--no-plugins", flag=True, description="Disables plugins.")
+
+# Remove when support for Python 3.6 is removed
+# https://github.com/python-poetry/poetry/issues/3412
+_NEEDS_UTF8_REWRAP = not PY37
+
+# Poetry's own CLI styles
+_STYLES = (
+    ("c1", Style("cyan")),
+    ("c2", Style("default", options=["bold"])),
+    ("info", Style("blue")),
+    ("comment", Style("green")),
+    ("warning", Style("yellow")),
+    ("debug", Style("default", options=["dark"])),
+    ("success", Style("green")),
+    # Dark variants
+    ("c1_dark", Style("cyan", options=["dark"])),
+    ("c2_dark", Style("default", options=["bold", "dark"])),
+    ("success_dark", Style("green", options=["dark"])),
+)
+
+_SHORTCUT_SPLIT = re.compile(r"\|-?")
+
+_BASE_LOGGERS = (
+    "poetry.packages.locker",
+    "poetry.packages.package",
+    "poetry.utils.password_manager",
+)
+
+_LOGGERS: Dict[str, logging.Logger] = {}
+
+
+def _get_logger(name: str) -> logging.Logger:
+    # Cache loggers to avoid going through the logging
+    # manager (and its lock) on every COMMAND event.
+    logger = _LOGGERS.get(name)
+    if logger is None:
+        logger = _LOGGERS[name] = logging.getLogger(name)
+
+    return logger
+
 
 class Application(BaseApplication):
     def __init__(self) -> None:
+        from poetry.__version__ import __version__
+
         super().__init__("poetry", __version__)
 
         self._poetry = None
         self._io: Optional["IO"] = None
         self._disable_plugins = False
         self._plugins_loaded = False
+        self.__default_definition: Optional["Definition"] = None
+        self.__solution_providers: Optional["SolutionProviderRepository"] = None
 
-        dispatcher = EventDispatcher()
-        dispatcher.add_listener(COMMAND, self.register_command_loggers)
-        dispatcher.add_listener(COMMAND, self.configure_env)
-        dispatcher.add_listener(COMMAND, self.configure_installer)
-        self.set_event_dispatcher(dispatcher)
-
-        command_loader = CommandLoader({name: load_command(name) for name in COMMANDS})
+        # The dict is copied so that factories registered by plugins
+        # do not leak into other Application instances.
+        command_loader = CommandLoader(dict(_COMMAND_FACTORIES))
         self.set_command_loader(command_loader)
 
     @property
     def poetry(self) -> "Poetry":
-        from pathlib import Path
-
-        from poetry.factory import Factory
-
         if self._poetry is not None:
             return self._poetry
 
-        self._poetry = Factory().create_poetry(
+        from pathlib import Path
+
+        self._poetry = _Factory().create_poetry(
             Path.cwd(), io=self._io, disable_plugins=self._disable_plugins
         )
 
@@ -138,10 +224,8 @@ class Application(BaseApplication):
     ) -> "IO":
         io = super().create_io(input, output, error_output)
 
-        # Remove when support for Python 3.6 is removed
-        # https://github.com/python-poetry/poetry/issues/3412
         if (
-            not PY37
+            _NEEDS_UTF8_REWRAP
             and hasattr(io.output, "_stream")
             and hasattr(io.output._stream, "buffer")
             and io.output._stream.encoding != "utf-8"
@@ -154,20 +238,11 @@ class Application(BaseApplication):
 
         # Set our own CLI styles
         formatter = io.output.formatter
-        formatter.set_style("c1", Style("cyan"))
-        formatter.set_style("c2", Style("default", options=["bold"]))
-        formatter.set_style("info", Style("blue"))
-        formatter.set_style("comment", Style("green"))
-        formatter.set_style("warning", Style("yellow"))
-        formatter.set_style("debug", Style("default", options=["dark"]))
-        formatter.set_style("success", Style("green"))
-
-        # Dark variants
-        formatter.set_style("c1_dark", Style("cyan", options=["dark"]))
-        formatter.set_style("c2_dark", Style("default", options=["bold", "dark"]))
-        formatter.set_style("success_dark", Style("green", options=["dark"]))
-
-        io.output.set_formatter(formatter)
+        for name, style in _STYLES:
+            formatter.set_style(name, style)
+
+        # The error output has its own formatter by default:
+        # share the one we just configured with it.
         io.error_output.set_formatter(formatter)
 
         self._io = io
@@ -182,43 +257,80 @@ class Application(BaseApplication):
         super().render_error(error, io)
 
     def _run(self, io: "IO") -> int:
-        self._disable_plugins = io.input.parameter_option("--no-plugins")
+        self._disable_plugins = io.input.has_parameter_option("--no-plugins")
+
+        # The dispatcher must exist before plugins are activated
+        # since they are allowed to register their own listeners.
+        self._ensure_dispatcher()
 
-        self._load_plugins(io)
+        self._load_plugins(io, self._disable_plugins)
 
         return super()._run(io)
 
+    def _run_command(self, command: "BaseCommand", io: "IO") -> int:
+        # Commands can also be run directly (e.g. via Command.call())
+        # without going through _run().
+        self._ensure_dispatcher()
+
+        return super()._run_command(command, io)
+
+    def _ensure_dispatcher(self) -> None:
+        if self._event_dispatcher is not None:
+            return
+
+        from cleo.events.console_events import COMMAND
+        from cleo.events.event_dispatcher import EventDispatcher
+
+        dispatcher = EventDispatcher()
+        dispatcher.add_listener(COMMAND, self.register_command_loggers)
+        dispatcher.add_listener(COMMAND, self.configure_env)
+        dispatcher.add_listener(COMMAND, self.configure_installer)
+        self.set_event_dispatcher(dispatcher)
+
     def _configure_io(self, io: "IO") -> None:
         # We need to check if the command being run
-        # is the "run" command.
-        definition = self.definition
-        with suppress(CleoException):
-            io.input.bind(definition)
-
+        # is the "run" command. All the global options are flags,
+        # so first_argument is reliable even on the unbound input.
         name = io.input.first_argument
         if name == "run":
+            definition = self.definition
+            with suppress(CleoException):
+                io.input.bind(definition)
+
             from poetry.console.io.inputs.run_argv_input import RunArgvInput
 
             input = cast(ArgvInput, io.input)
-            run_input = RunArgvInput([self._name or ""] + input._tokens)
+            tokens = [self._name or ""]
+            tokens.extend(input._tokens)
+            run_input = RunArgvInput(tokens)
             # For the run command reset the definition
             # with only the set options (i.e. the options given before the command)
-            for option_name, value in input.options.items():
-                if value:
-                    option = definition.option(option_name)
-                    run_input.add_parameter_option("--" + option.name)
-                    if option.shortcut:
-                        shortcuts = re.split(r"\|-?", option.shortcut.lstrip("-"))
-                        shortcuts = [s for s in shortcuts if s]
-                        for shortcut in shortcuts:
-                            run_input.add_parameter_option("-" + shortcut.lstrip("-"))
+            set_options = [
+                (option_name, value)
+                for option_name, value in input.options.items()
+                if value
+            ]
+
+            for option_name, _value in set_options:
+                option = definition.option(option_name)
+                run_input.add_parameter_option("--" + option.name)
+                if option.shortcut:
+                    stripped = option.shortcut.lstrip("-")
+                    if "|" in stripped:
+                        shortcuts = _SHORTCUT_SPLIT.split(stripped)
+                    else:
+                        # Most shortcuts are a single character,
+                        # so the regex is not needed.
+                        shortcuts = [stripped]
+                    shortcuts = [s for s in shortcuts if s]
+                    for shortcut in shortcuts:
+                        run_input.add_parameter_option("-" + shortcut.lstrip("-"))
 
             with suppress(CleoException):
                 run_input.bind(definition)
 
-            for option_name, value in input.options.items():
-                if value:
-                    run_input.set_option(option_name, value)
+            for option_name, value in set_options:
+                run_input.set_option(option_name, value)
 
             io.set_input(run_input)
 
@@ -236,41 +348,38 @@ class Application(BaseApplication):
 
         io = event.io
 
-        loggers = [
-            "poetry.packages.locker",
-            "poetry.packages.package",
-            "poetry.utils.password_manager",
-        ]
-
-        loggers += command.loggers
-
         handler = IOHandler(io)
         handler.setFormatter(IOFormatter())
 
-        for logger in loggers:
-            logger = logging.getLogger(logger)
+        if io.is_debug():
+            level = logging.DEBUG
+        elif io.is_very_verbose() or io.is_verbose():
+            level = logging.INFO
+        else:
+            level = logging.WARNING
 
-            logger.handlers = [handler]
+        for name in chain(_BASE_LOGGERS, command.loggers):
+            logger = _get_logger(name)
 
-            level = logging.WARNING
+            logger_level = level
             # The builders loggers are special and we can actually
             # start at the INFO level.
-            if logger.name.startswith("poetry.core.masonry.builders"):
-                level = logging.INFO
+            if level == logging.WARNING and name.startswith(
+                "poetry.core.masonry.builders"
+            ):
+                logger_level = logging.INFO
 
-            if io.is_debug():
-                level = logging.DEBUG
-            elif io.is_very_verbose() or io.is_verbose():
-                level = logging.INFO
+            logger.handlers = [handler]
 
-            logger.setLevel(level)
+            if logger.level != logger_level:
+                logger.setLevel(logger_level)
 
     def configure_env(
         self, event: "ConsoleCommandEvent", event_name: str, _: Any
     ) -> None:
         from poetry.console.commands.env_command import EnvCommand
 
-        command: EnvCommand = cast(EnvCommand, event.command)
+        command = event.command
         if not isinstance(command, EnvCommand):
             return
 
@@ -295,7 +404,7 @@ class Application(BaseApplication):
     ) -> None:
         from poetry.console.commands.installer_command import InstallerCommand
 
-        command: "InstallerCommand" = cast(InstallerCommand, event.command)
+        command = event.command
         if not isinstance(command, InstallerCommand):
             return
 
@@ -307,10 +416,8 @@ class Application(BaseApplication):
         self._configure_installer(command, event.io)
 
     def _configure_installer(self, command: "InstallerCommand", io: "IO") -> None:
-        from poetry.installation.installer import Installer
-
         poetry = command.poetry
-        installer = Installer(
+        installer = _Installer(
             io,
             command.env,
             poetry.package,
@@ -321,11 +428,16 @@ class Application(BaseApplication):
         installer.use_executor(poetry.config.get("experimental.new-installer", False))
         command.set_installer(installer)
 
-    def _load_plugins(self, io: "IO") -> None:
+    def _load_plugins(self, io: "IO", disable_plugins: Optional[bool] = None) -> None:
         if self._plugins_loaded:
             return
 
-        self._disable_plugins = io.input.has_parameter_option("--no-plugins")
+        if disable_plugins is None:
+            # The flag has not been parsed yet (e.g. when called
+            # outside of _run()).
+            disable_plugins = io.input.has_parameter_option("--no-plugins")
+
+        self._disable_plugins = disable_plugins
 
         if not self._disable_plugins:
             from poetry.plugins.plugin_manager import PluginManager
@@ -338,29 +450,30 @@ class Application(BaseApplication):
 
     @property
     def _default_definition(self) -> "Definition":
-        from cleo.io.inputs.option import Option
-
-        definition = super()._default_definition
+        if self.__default_definition is None:
+            definition = super()._default_definition
+            definition.add_option(_NO_PLUGINS_OPTION)
 
-        definition.add_option(
-            Option("--no-plugins", flag=True, description="Disables plugins.")
-        )
+            self.__default_definition = definition
 
-        return definition
+        return self.__default_definition
 
     def _get_solution_provider_repository(self) -> "SolutionProviderRepository":
-        from crashtest.solution_providers.solution_provider_repository import (
-            SolutionProviderRepository,
-        )
+        if self.__solution_providers is None:
+            from crashtest.solution_providers.solution_provider_repository import (
+                SolutionProviderRepository,
+            )
 
-        from poetry.mixology.solutions.providers.python_requirement_solution_provider import (
-            PythonRequirementSolutionProvider,
-        )
+            from poetry.mixology.solutions.providers.python_requirement_solution_provider import (
+                PythonRequirementSolutionProvider,
+            )
+
+            repository = SolutionProviderRepository()
+            repository.register_solution_providers([PythonRequirementSolutionProvider])
 
-        repository = SolutionProviderRepository()
-        repository.register_solution_providers([PythonRequirementSolutionProvider])
+            self.__solution_providers = repository
 
-        return repository
+        return self.__solution_providers
 
 
 def main() -> int:
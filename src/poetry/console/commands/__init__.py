@@ -0,0 +1,11 @@
+from importlib import import_module
+from types import ModuleType
+
+
+def __getattr__(name: str) -> ModuleType:
+    # Defer the import of command modules (PEP 562) so that only the
+    # command actually being executed is resolved.
+    try:
+        return import_module(f"{__name__}.{name}")
+    except ImportError:
+        raise AttributeError(name)
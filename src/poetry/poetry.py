@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
-from typing import List
 from typing import Optional
+from typing import Tuple
 
 from poetry.core.poetry import Poetry as BasePoetry
 
@@ -31,13 +31,11 @@ class Poetry(BasePoetry):
         locker: "Locker",
         config: "Config",
     ):
-        from poetry.repositories.pool import Pool
-
         super().__init__(file, local_config, package)
 
         self._locker = locker
         self._config = config
-        self._pool = Pool()
+        self._pool: Optional["Pool"] = None
         self._plugin_manager: Optional["PluginManager"] = None
 
     @property
@@ -46,6 +44,11 @@ class Poetry(BasePoetry):
 
     @property
     def pool(self) -> "Pool":
+        if self._pool is None:
+            from poetry.repositories.pool import Pool
+
+            self._pool = Pool()
+
         return self._pool
 
     @property
@@ -72,8 +75,10 @@ class Poetry(BasePoetry):
 
         return self
 
-    def get_sources(self) -> List[Source]:
-        return [
+    def get_sources(self) -> Tuple[Source, ...]:
+        # Not cached: the source commands mutate the pyproject
+        # configuration in place.
+        return tuple(
             Source(**source)
-            for source in self.pyproject.poetry_config.get("source", [])
-        ]
+            for source in self.pyproject.poetry_config.get("source", ())
+        )
@@ -31,7 +31,7 @@ def assert_source_added(
     )
     poetry.pyproject.reload()
     sources = poetry.get_sources()
-    assert sources == [source_existing, source_added]
+    assert sources == (source_existing, source_added)
     assert tester.status_code == 0
 
 
@@ -35,7 +35,7 @@ def test_source_remove_simple(
 
     poetry_with_source.pyproject.reload()
     sources = poetry_with_source.get_sources()
-    assert sources == [source_one, source_two]
+    assert sources == (source_one, source_two)
 
     assert tester.status_code == 0
 